@@ -5,20 +5,74 @@ Build Script for PoorMan
 ~~~~~~~~~~~~~~~~~~~~~
 
 This script creates a Windows executable using PyInstaller.
-Run this script to generate the executable in the dist/ directory.
+Run this script to generate the application folder in dist/PoorMan/.
+
+The build uses onedir mode rather than onefile: a onefile executable has to
+unpack its whole archive to a temporary directory on every launch, which
+dominates startup time. Ship the dist/PoorMan/ folder as a whole (for
+example, wrapped in an NSIS or Inno Setup installer).
 
 Usage:
-    python build_exe.py
+    python build_exe.py            # debug build, symbols kept
+    python build_exe.py --release  # strip and UPX-compress the binaries
 
 Requirements:
     pip install pyinstaller
 """
 
 import PyInstaller.__main__
+import PyInstaller.archive.writers
 import os
+import pkgutil
+import shutil
 import sys
 
-def build_exe():
+# zlib level used for modules in the PYZ archive. Level 0 writes stored
+# blocks, which the bootloader's zlib.decompress() copies out without any
+# inflate work. The archive gets larger on disk, but in onedir mode it is
+# read straight from the install folder, so decompression CPU at startup is
+# the cost that matters.
+PYZ_COMPRESSION_LEVEL = 0
+
+def configure_archive_compression():
+    """Lower the PYZ compression level used by PyInstaller's archive writer"""
+    writer = PyInstaller.archive.writers.ZlibArchiveWriter
+    if hasattr(writer, '_COMPRESSION_LEVEL'):
+        writer._COMPRESSION_LEVEL = PYZ_COMPRESSION_LEVEL
+    else:
+        print("Warning: PyInstaller archive writer has no compression setting; using defaults")
+
+def collect_hidden_imports(src_dir, prefix=''):
+    """List every module under src_dir without importing any of them"""
+    modules = []
+    for info in pkgutil.iter_modules([src_dir], prefix):
+        modules.append(info.name)
+        if info.ispkg:
+            sub_dir = os.path.join(src_dir, info.name.rsplit('.', 1)[-1])
+            modules.extend(collect_hidden_imports(sub_dir, info.name + '.'))
+    return modules
+
+def compression_args(release):
+    """PyInstaller options for stripping and UPX-compressing binaries"""
+    if not release:
+        # Debug builds keep symbols; PyInstaller would otherwise use any
+        # UPX found on PATH
+        return ['--noupx']
+    
+    # PyInstaller applies these to the bootloader and collected binaries
+    # before it appends its archive to the executable; stripping or
+    # compressing the finished executable afterwards would drop the archive.
+    # UPX drops relocation data, so check the compressed exe still starts on
+    # Windows before publishing a release.
+    args = ['--strip']
+    upx = shutil.which('upx')
+    if upx:
+        args.append(f'--upx-dir={os.path.dirname(upx)}')
+    else:
+        print("Warning: upx not found on PATH, skipping UPX compression")
+    return args
+
+def build_exe(release=False):
     """Build the executable using PyInstaller"""
     # Get the absolute path of the script directory
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -41,32 +95,54 @@ def build_exe():
     args = [
         main_script,  
         '--name=PoorMan',  
-        '--onefile',  # Create a single executable file
+        '--onedir',  # Keep files unpacked next to the executable for fast startup
         '--windowed',  # Don't show console window when running the executable
         '--icon=' + icon_path,  
-        '--add-data=src;src',  # Include the src directory
         f'--add-data={resources_path};resources',  # Include the resources directory
         '--clean',  # Clean PyInstaller cache
         '--noconfirm',  # Replace existing dist directory without confirmation
     ]
     
-    # Add hidden imports for tkinter
+    # Only our own modules need help: third-party packages such as requests
+    # and tkinter are found by PyInstaller's static analysis already.
+    src_dir = os.path.join(script_dir, 'src')
     hidden_imports = [
-        '--hidden-import=tkinter',
-        '--hidden-import=tkinter.ttk',
-        '--hidden-import=requests',
-        '--hidden-import=requests_oauthlib',
-        '--hidden-import=urllib3',
+        f'--hidden-import={name}'
+        for name in collect_hidden_imports(src_dir)
+        if name != 'main'
     ]
     
     args.extend(hidden_imports)
     
+    # Leave out build tooling and stdlib test suites nothing in src/ needs.
+    # Check build/PoorMan/Analysis-00.toc when adding dependencies.
+    excluded_modules = [
+        'setuptools',
+        'pip',
+        'pytest',
+        'unittest',
+        'test',
+        'email.test',
+        'tkinter.test',
+        'distutils',
+        'lib2to3',
+        'pydoc_data',
+        'xmlrpc',
+    ]
+    
+    args.extend(f'--exclude-module={name}' for name in excluded_modules)
+    
+    # Shrink binaries for release builds; debug builds keep symbols
+    args.extend(compression_args(release))
+    
     print(f"Building executable from: {main_script}")
     print(f"Working directory: {script_dir}")
     print(f"Including resources from: {resources_path}")
     
+    configure_archive_compression()
+    
     # Run PyInstaller
     PyInstaller.__main__.run(args)
 
 if __name__ == '__main__':
-    build_exe() 
\ No newline at end of file
+    build_exe(release='--release' in sys.argv[1:]) 
\ No newline at end of file
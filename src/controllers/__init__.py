@@ -10,10 +10,9 @@ Controllers handle user actions and update the UI accordingly.
 Available Controllers:
     - RequestController: Manages HTTP request operations and responses
 
+Import controllers from their modules, e.g.
+``from controllers.request_controller import RequestController``.
+
 :copyright: (c) 2024 by Rohit Gupta.
 :license: Apache 2.0, see LICENSE for more details.
 """
-
-from .request_controller import RequestController
-
-__all__ = ['RequestController'] 
\ No newline at end of file
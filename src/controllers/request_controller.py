@@ -1,5 +1,7 @@
-from typing import Optional, Callable
+from typing import Callable, List, Optional
+import queue
 import threading
+import tkinter as tk
 from tkinter import messagebox
 
 from models.request_model import RequestModel
@@ -7,38 +9,79 @@ from models.response_model import ResponseModel
 from services.request_service import RequestService
 from services.storage_service import StorageService
 from utils.logging_config import logger
-import json
+import orjson
 
 class RequestController:
-    def __init__(self, on_response_received: Callable[[ResponseModel], None]):
+    # Most requests sent at the same time
+    MAX_WORKERS = 4
+    
+    def __init__(self, root: tk.Misc, on_response_received: Callable[[ResponseModel], None]):
+        # Tk is not thread-safe: UI work from worker threads is queued on root
+        self.root = root
         self.request_service = RequestService()
         self.storage_service = StorageService()
         self.on_response_received = on_response_received
-        self.current_request: Optional[RequestModel] = None
+        # Reused worker threads for sending requests, started as needed up to
+        # MAX_WORKERS. They are daemon threads so an in-flight request never
+        # keeps the process alive after the window closes (ThreadPoolExecutor
+        # workers are joined at interpreter exit).
+        self._requests: "queue.SimpleQueue[Optional[RequestModel]]" = queue.SimpleQueue()
+        self._workers: List[threading.Thread] = []
+        self._closed = False
     
     def send_request(self, request: RequestModel):
-        """Send HTTP request in a separate thread"""
-        # Pre-validate JSON body to surface errors early
+        """Send HTTP request on a worker thread"""
+        # Pre-validate JSON body to surface errors early, with the same
+        # parser the request service checks it with
         if request.body_type == "json" and request.body_content.strip():
             try:
-                json.loads(request.body_content)
-            except json.JSONDecodeError as e:
+                orjson.loads(request.body_content)
+            except orjson.JSONDecodeError as e:
                 logger.error("Invalid JSON body: %s", str(e), exc_info=True)
                 messagebox.showerror("Invalid JSON", f"The JSON body is invalid.\n\n{e}")
                 return
 
-        self.current_request = request
-        threading.Thread(target=self._send_request_thread, daemon=True).start()
+        self._requests.put(request)
+        if len(self._workers) < self.MAX_WORKERS:
+            worker = threading.Thread(
+                target=self._worker_loop,
+                name=f"req_{len(self._workers)}",
+                daemon=True
+            )
+            self._workers.append(worker)
+            worker.start()
+    
+    def _worker_loop(self):
+        """Send queued requests until shutdown"""
+        while True:
+            request = self._requests.get()
+            if request is None or self._closed:
+                return
+            self._send_request_thread(request)
     
-    def _send_request_thread(self):
-        """Handle request sending in a separate thread"""
+    def _send_request_thread(self, request: RequestModel):
+        """Handle request sending on a worker thread"""
         try:
-            response = self.request_service.send_request(self.current_request)
+            response = self.request_service.send_request(request)
+            # The window may have closed while the request was in flight
+            if self._closed:
+                return
             # Notify UI with response
-            self.on_response_received(response)
+            self.root.after(0, self.on_response_received, response)
         except Exception as e:
             logger.exception("Unhandled exception during request sending")
-            messagebox.showerror("Request Error", str(e))
+            if not self._closed:
+                self._show_error("Request Error", str(e))
+    
+    def _show_error(self, title: str, message: str):
+        """Show an error dialog from the Tk event loop without blocking the caller"""
+        self.root.after(0, messagebox.showerror, title, message)
+    
+    def shutdown(self):
+        """Drop queued requests and let the worker threads exit"""
+        self._closed = True
+        for _ in self._workers:
+            self._requests.put(None)
     
     def save_request(self, request: RequestModel, file_path: str):
         """Save request configuration to file"""
@@ -46,7 +89,7 @@ class RequestController:
             self.storage_service.save_request(request, file_path)
         except Exception as e:
             logger.exception("Failed to save request")
-            messagebox.showerror("Save Error", str(e))
+            self._show_error("Save Error", str(e))
     
     def load_request(self, file_path: str) -> Optional[RequestModel]:
         """Load request configuration from file"""
@@ -54,7 +97,7 @@ class RequestController:
             return self.storage_service.load_request(file_path)
         except Exception as e:
             logger.exception("Failed to load request")
-            messagebox.showerror("Load Error", str(e))
+            self._show_error("Load Error", str(e))
             return None
     
     def setup_oauth2(self, client_id: str, redirect_uri: str, scope: str = None) -> Optional[str]:
@@ -63,7 +106,7 @@ class RequestController:
             return self.request_service.setup_oauth2_session(client_id, redirect_uri, scope)
         except Exception as e:
             logger.exception("OAuth2 setup error")
-            messagebox.showerror("OAuth2 Error", str(e))
+            self._show_error("OAuth2 Error", str(e))
             return None
     
     def get_oauth2_token(self, code: str, client_secret: str, token_url: str) -> bool:
@@ -73,5 +116,5 @@ class RequestController:
             return True
         except Exception as e:
             logger.exception("OAuth2 token retrieval error")
-            messagebox.showerror("OAuth2 Error", str(e))
+            self._show_error("OAuth2 Error", str(e))
             return False 
\ No newline at end of file
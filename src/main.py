@@ -12,15 +12,26 @@ and for creating the executable.
 :license: Apache 2.0, see LICENSE for more details.
 """
 
-import os
 import sys
 import tkinter as tk
+from pathlib import Path
 from tkinter import ttk
 from views.main_window import MainWindow
-from utils.logging_config import logger, install_global_exception_hooks
+from utils.logging_config import (
+    logger, ensure_file_logging, install_global_exception_hooks
+)
+
+# Resolved once at import. When frozen, build_exe.py bundles resources/ into
+# the PyInstaller data directory, so the file is known to be there.
+if getattr(sys, 'frozen', False):
+    ICON_PATH = Path(sys._MEIPASS) / 'resources' / 'poorman.ico'
+else:
+    ICON_PATH = Path(__file__).resolve().parent.parent / 'resources' / 'poorman.ico'
 
 def main():
     """Main function to run the application"""
+    ensure_file_logging()
+    
     # Create root window but don't show it yet
     root = tk.Tk()
     root.withdraw()
@@ -30,27 +41,9 @@ def main():
     
     # Set application icon
     try:
-        # Get the directory containing the script/executable
-        if getattr(sys, 'frozen', False):
-            # If running as compiled executable
-            base_dir = os.path.dirname(sys.executable)
-            icon_path = os.path.join(base_dir, 'resources', 'poorman.ico')
-            if not os.path.exists(icon_path):
-                # Try looking in temp directory where PyInstaller extracts files
-                base_dir = sys._MEIPASS
-                icon_path = os.path.join(base_dir, 'resources', 'poorman.ico')
-        else:
-            # If running as script
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            icon_path = os.path.join(base_dir, 'resources', 'poorman.ico')
-        
-        # Load and set the icon
-        if os.path.exists(icon_path):
-            root.iconbitmap(icon_path)
-        else:
-            logger.warning("Could not find icon at %s", icon_path)
-    except Exception as e:
-        logger.exception("Could not load application icon")
+        root.iconbitmap(str(ICON_PATH))
+    except Exception:
+        logger.exception("Could not load application icon from %s", ICON_PATH)
     
     # Configure style
     style = ttk.Style()
@@ -11,11 +11,9 @@ Available Models:
     - RequestModel: Represents an HTTP request with all its parameters
     - ResponseModel: Represents an HTTP response with its data
 
+Import models from their modules, e.g.
+``from models.request_model import RequestModel``.
+
 :copyright: (c) 2024 by Rohit Gupta.
 :license: Apache 2.0, see LICENSE for more details.
 """
-
-from .request_model import RequestModel
-from .response_model import ResponseModel
-
-__all__ = ['RequestModel', 'ResponseModel'] 
\ No newline at end of file
@@ -2,7 +2,17 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 from datetime import datetime
 
-@dataclass
+# Version of the saved-request file layout written by to_dict. Version 1
+# stored params/headers/form_data as lists of {'key': ..., 'value': ...}.
+SCHEMA_VERSION = 2
+
+def _pairs_to_dict(value) -> Dict[str, str]:
+    """Accept both the current dict layout and the version 1 key/value list"""
+    if isinstance(value, list):
+        return {item['key']: item['value'] for item in value}
+    return dict(value)
+
+@dataclass(slots=True)
 class RequestModel:
     method: str = "GET"
     url: str = ""
@@ -13,17 +23,36 @@ class RequestModel:
     form_data: Dict[str, str] = field(default_factory=dict)
     auth_type: str = "none"  # none, basic, bearer, oauth1, oauth2
     auth_data: Dict[str, str] = field(default_factory=dict)
+    # Result of the last to_dict() call; cleared whenever a field is assigned
+    _dict_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name, value):
+        if name != '_dict_cache':
+            object.__setattr__(self, '_dict_cache', None)
+        object.__setattr__(self, name, value)
     
     def to_dict(self) -> dict:
-        """Convert the request model to a dictionary for saving"""
+        """
+        Convert the request model to a dictionary for saving.
+        
+        The result is cached until a field is reassigned and shares the
+        params/headers/form_data/auth_data dicts with the model, so callers
+        must treat it as read-only.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return self._dict_cache
+    
+    def _build_dict(self) -> dict:
         return {
+            'schema': SCHEMA_VERSION,
             'method': self.method,
             'url': self.url,
-            'params': [{'key': k, 'value': v} for k, v in self.params.items()],
-            'headers': [{'key': k, 'value': v} for k, v in self.headers.items()],
+            'params': self.params,
+            'headers': self.headers,
             'body_type': self.body_type,
             'body_content': self.body_content,
-            'form_data': [{'key': k, 'value': v} for k, v in self.form_data.items()],
+            'form_data': self.form_data,
             'auth_type': self.auth_type,
             'auth_data': self.auth_data
         }
@@ -31,9 +60,9 @@ class RequestModel:
     @classmethod
     def from_dict(cls, data: dict) -> 'RequestModel':
         """Create a request model from a dictionary"""
-        params = {item['key']: item['value'] for item in data.get('params', [])}
-        headers = {item['key']: item['value'] for item in data.get('headers', [])}
-        form_data = {item['key']: item['value'] for item in data.get('form_data', [])}
+        params = _pairs_to_dict(data.get('params', {}))
+        headers = _pairs_to_dict(data.get('headers', {}))
+        form_data = _pairs_to_dict(data.get('form_data', {}))
         
         return cls(
             method=data.get('method', 'GET'),
@@ -1,16 +1,23 @@
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Mapping, Optional
 from datetime import datetime
 
-@dataclass
+# (unit, divisor) indexed by how many multiples of 10 bits the size spans
+_SIZE_UNITS = (("bytes", 1), ("KB", 1024), ("MB", 1024 ** 2), ("GB", 1024 ** 3))
+
+@dataclass(slots=True)
 class ResponseModel:
     status_code: int
     reason: str
-    headers: dict
+    headers: Mapping[str, str]  # case-insensitive when built from a requests response
     content: bytes
     elapsed_time: float  # in milliseconds
     timestamp: datetime = field(default_factory=datetime.now)
     error: Optional[str] = None
+    # Display text for the body, decoded and pretty-printed JSON; filled in
+    # by the response panel on first display
+    _decoded: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _formatted_json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     @property
     def is_success(self) -> bool:
@@ -26,11 +33,12 @@ class ResponseModel:
     
     @property
     def size_formatted(self) -> str:
-        """Get formatted size (bytes, KB)"""
+        """Get formatted size (bytes, KB, MB, GB)"""
         size = self.size
-        if size > 1024:
-            return f"{round(size / 1024, 2)} KB"
-        return f"{size} bytes"
+        unit, divisor = _SIZE_UNITS[min(max(size.bit_length() - 1, 0) // 10, 3)]
+        if divisor == 1:
+            return f"{size} bytes"
+        return f"{round(size / divisor, 2)} {unit}"
     
     @classmethod
     def from_error(cls, error: Exception) -> 'ResponseModel':
@@ -11,11 +11,10 @@ Available Services:
     - RequestService: Handles HTTP request execution and response processing
     - StorageService: Manages saving and loading of request configurations
 
+Services are not re-exported here, since doing so would load the HTTP
+stack on any package import; use ``services.request_service`` and
+``services.storage_service`` directly.
+
 :copyright: (c) 2024 by Rohit Gupta.
 :license: Apache 2.0, see LICENSE for more details.
 """
-
-from .request_service import RequestService
-from .storage_service import StorageService
-
-__all__ = ['RequestService', 'StorageService'] 
\ No newline at end of file
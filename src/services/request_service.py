@@ -1,55 +1,75 @@
-import json
+import threading
 import time
-from typing import Optional
-import requests
-from requests.auth import HTTPBasicAuth
-from requests_oauthlib import OAuth1, OAuth2Session
-import urllib3
+from typing import Optional, TYPE_CHECKING
+
+import orjson
 
 from models.request_model import RequestModel
 from models.response_model import ResponseModel
 from utils.logging_config import logger
 
-# Disable SSL warnings for testing purposes
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# requests, requests_oauthlib and urllib3 are imported on first use rather
+# than here: they pull in ssl, idna, charset detection etc., and this module
+# is loaded before the main window is shown.
+if TYPE_CHECKING:
+    import requests
+    from requests_oauthlib import OAuth2Session
 
 class RequestService:
+    _warnings_disabled = False
+    
     def __init__(self):
-        self.oauth_session: Optional[OAuth2Session] = None
+        self.session: Optional["requests.Session"] = None
+        # Worker threads may send their first requests at the same time
+        self._session_lock = threading.Lock()
+        self.oauth_session: Optional["OAuth2Session"] = None
         self.oauth_token: Optional[dict] = None
     
     def send_request(self, request: RequestModel) -> ResponseModel:
         """Send an HTTP request and return the response"""
         try:
-            start_time = time.time()
+            self._disable_ssl_warnings()
+            
+            # Work on a copy so the caller's request model is never mutated
+            headers = dict(request.headers)
             
             # Prepare authentication
-            auth = self._prepare_auth(request)
+            auth = self._prepare_auth(request, headers)
             
             # Prepare request data
             data = None
-            json_data = None
             
             if request.body_type == "raw":
                 data = request.body_content
-            elif request.body_type == "json":
+            elif request.body_type == "json" and request.body_content.strip():
+                # Only validate: the body is sent exactly as typed, since
+                # re-serializing it could change values such as integers
+                # beyond 64 bits
                 try:
-                    json_data = json.loads(request.body_content)
-                    request.headers["Content-Type"] = "application/json"
-                except json.JSONDecodeError:
-                    if request.body_content.strip():
-                        raise ValueError("Invalid JSON format")
+                    orjson.loads(request.body_content)
+                except orjson.JSONDecodeError:
+                    raise ValueError("Invalid JSON format")
+                data = request.body_content.encode('utf-8')
+                if not any(key.lower() == "content-type" for key in headers):
+                    headers["Content-Type"] = "application/json"
             elif request.body_type == "form":
                 data = request.form_data
             
+            # Every request shares one keep-alive session so repeat calls skip
+            # the TCP/TLS handshake
+            session = self._get_session()
+            
+            # Time only the request itself: the lazy imports done while
+            # preparing auth and the session are not part of it
+            start_time = time.time()
+            
             # Make request
-            response = requests.request(
+            response = session.request(
                 method=request.method,
                 url=request.url,
                 params=request.params,
-                headers=request.headers,
+                headers=headers,
                 data=data,
-                json=json_data,
                 auth=auth,
                 verify=False,  # For HTTPS with self-signed certificates
                 timeout=30
@@ -60,7 +80,7 @@ class RequestService:
             return ResponseModel(
                 status_code=response.status_code,
                 reason=response.reason,
-                headers=dict(response.headers),
+                headers=response.headers,
                 content=response.content,
                 elapsed_time=elapsed_time
             )
@@ -69,11 +89,35 @@ class RequestService:
             logger.exception("HTTP request failed: %s %s", request.method, request.url)
             return ResponseModel.from_error(e)
     
-    def _prepare_auth(self, request: RequestModel):
-        """Prepare authentication for the request"""
+    def _get_session(self) -> "requests.Session":
+        """Return the shared HTTP session, creating it on first use"""
+        if self.session is None:
+            with self._session_lock:
+                if self.session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self.session = session
+        return self.session
+    
+    @classmethod
+    def _disable_ssl_warnings(cls):
+        """Disable SSL warnings for testing purposes (once per process)"""
+        if not cls._warnings_disabled:
+            import urllib3
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            cls._warnings_disabled = True
+    
+    def _prepare_auth(self, request: RequestModel, headers: dict):
+        """Prepare authentication for the request, adding any auth headers to headers"""
         auth = None
         
         if request.auth_type == "basic":
+            from requests.auth import HTTPBasicAuth
             username = request.auth_data.get("username", "")
             password = request.auth_data.get("password", "")
             if username or password:
@@ -82,7 +126,7 @@ class RequestService:
         elif request.auth_type == "bearer":
             token = request.auth_data.get("token", "")
             if token:
-                request.headers["Authorization"] = f"Bearer {token}"
+                headers["Authorization"] = f"Bearer {token}"
         
         elif request.auth_type == "oauth1":
             consumer_key = request.auth_data.get("consumer_key", "")
@@ -91,15 +135,21 @@ class RequestService:
             token_secret = request.auth_data.get("token_secret", "")
             
             if all([consumer_key, consumer_secret]):
+                from requests_oauthlib import OAuth1
                 auth = OAuth1(consumer_key, consumer_secret, token, token_secret)
         
-        elif request.auth_type == "oauth2" and self.oauth_token:
-            request.headers["Authorization"] = f"Bearer {self.oauth_token.get('access_token', '')}"
+        elif request.auth_type == "oauth2":
+            # Send the token as a plain header rather than through
+            # OAuth2Session, which refuses non-https URLs
+            access_token = (self.oauth_token or {}).get("access_token")
+            if access_token:
+                headers["Authorization"] = f"Bearer {access_token}"
         
         return auth
     
     def setup_oauth2_session(self, client_id: str, redirect_uri: str, scope: str = None) -> str:
         """Set up OAuth2 session and return the authorization URL"""
+        from requests_oauthlib import OAuth2Session
         self.oauth_session = OAuth2Session(client_id, redirect_uri=redirect_uri, scope=scope.split() if scope else None)
         authorization_url, _ = self.oauth_session.authorization_url(request.auth_data["auth_url"])
         return authorization_url
@@ -1,5 +1,7 @@
-import json
 from typing import Optional
+
+import orjson
+
 from models.request_model import RequestModel
 from utils.logging_config import logger
 
@@ -8,8 +10,8 @@ class StorageService:
     def save_request(request: RequestModel, file_path: str) -> None:
         """Save request configuration to a file"""
         try:
-            with open(file_path, 'w') as f:
-                json.dump(request.to_dict(), f, indent=2)
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(request.to_dict(), option=orjson.OPT_INDENT_2))
         except Exception as e:
             logger.exception("Failed to save request to %s", file_path)
             raise IOError(f"Failed to save request: {str(e)}")
@@ -18,8 +20,8 @@ class StorageService:
     def load_request(file_path: str) -> RequestModel:
         """Load request configuration from a file"""
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
             return RequestModel.from_dict(data)
         except Exception as e:
             logger.exception("Failed to load request from %s", file_path)
@@ -10,10 +10,9 @@ These utilities provide common functionality and configuration.
 Available Utilities:
     - logging_config: Application-wide logging configuration and setup
 
+Import utilities from their modules, e.g.
+``from utils.logging_config import logger``.
+
 :copyright: (c) 2024 by Rohit Gupta.
 :license: Apache 2.0, see LICENSE for more details.
 """
-
-from .logging_config import logger, set_log_level, setup_logger
-
-__all__ = ['logger', 'set_log_level', 'setup_logger'] 
\ No newline at end of file
@@ -21,24 +21,39 @@ Example:
 :license: Apache 2.0, see LICENSE for more details.
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
+import re
 import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from version import __title__
 
-# Create logs directory if it doesn't exist
+# Skip the thread, process and multiprocessing lookups done for every
+# LogRecord; none of our formats use those fields.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Logs directory (created by ensure_file_logging)
 LOGS_DIR = Path("logs")
-LOGS_DIR.mkdir(exist_ok=True)
 
 # Log file path
 LOG_FILE = LOGS_DIR / f"{__title__.lower()}.log"
 
 # Log format with all necessary information
 LOG_FORMAT = (
+    "%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - "
+    "%(message)s"
+)
+
+# File log format used when POORMAN_DEBUG is set; adds the function name
+DEBUG_LOG_FORMAT = (
     "%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - "
     "%(funcName)s() - %(message)s"
 )
@@ -46,6 +61,21 @@ LOG_FORMAT = (
 # Date format for logs
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# File writes are batched: up to this many records are buffered, and the
+# buffer is flushed at least this often (ERROR and above flush immediately)
+FILE_BUFFER_CAPACITY = 256
+FILE_FLUSH_INTERVAL = 5.0  # seconds
+
+def _start_periodic_flush(handler: logging.Handler, interval: float) -> None:
+    """Flush handler every interval seconds from a daemon thread"""
+    def _flush_loop():
+        while not stop.wait(interval):
+            handler.flush()
+    
+    stop = threading.Event()
+    threading.Thread(target=_flush_loop, name="log-flush", daemon=True).start()
+    atexit.register(stop.set)
+
 def setup_logger(
     logger_name: str = __title__,
     log_file: Path = LOG_FILE,
@@ -55,6 +85,11 @@ def setup_logger(
     """
     Set up a logger with both file and console handlers.
     
+    The handlers run on a background QueueListener thread; the logger itself
+    only has a QueueHandler, so logging calls never wait on disk or console
+    I/O (including the rotating handler's size check). File records are
+    additionally batched by a MemoryHandler.
+    
     Args:
         logger_name: Name of the logger (default: application name)
         log_file: Path to the log file (default: logs/poorman.log)
@@ -67,34 +102,98 @@ def setup_logger(
     logger = logging.getLogger(logger_name)
     logger.setLevel(level)
     
+    # Create logs directory if it doesn't exist
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    
     # Create formatters
-    file_formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
+    file_format = DEBUG_LOG_FORMAT if os.environ.get("POORMAN_DEBUG") else LOG_FORMAT
+    file_formatter = logging.Formatter(file_format, DATE_FORMAT)
     console_formatter = logging.Formatter(
         "%(asctime)s - %(levelname)s - %(message)s",
         DATE_FORMAT
     )
     
-    # File handler (with rotation)
+    # File handler (with rotation); the file is opened on the first write,
+    # which happens on the listener thread
     file_handler = logging.handlers.RotatingFileHandler(
         log_file,
         maxBytes=5 * 1024 * 1024,  # 5MB
         backupCount=5,
-        encoding='utf-8'
+        encoding='utf-8',
+        delay=True
     )
     file_handler.setLevel(level)
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    
+    # Buffer file writes; flushed when full, on ERROR, periodically and at exit
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=FILE_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True
+    )
+    buffered_file_handler.setLevel(level)
+    _start_periodic_flush(buffered_file_handler, FILE_FLUSH_INTERVAL)
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(console_level or level)
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    
+    # Hand records to the real handlers on a background thread
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    listener = logging.handlers.QueueListener(
+        log_queue, buffered_file_handler, console_handler, respect_handler_level=True
+    )
+    queue_handler.listener = listener
+    logger.addHandler(queue_handler)
+    listener.start()
+    atexit.register(listener.stop)
     
     return logger
 
-# Create the default logger
-logger = setup_logger()
+# Whether the default logger emits DEBUG records; kept in sync by
+# set_log_level so hot paths can test a plain bool
+_debug_enabled = bool(os.environ.get("POORMAN_DEBUG"))
+
+# The default logger starts with only a NullHandler, so importing this module
+# creates no directory, file, thread or queue; ensure_file_logging() installs
+# the real handlers when the application starts
+logger = logging.getLogger(__title__)
+logger.addHandler(logging.NullHandler())
+
+_file_logging_ready = False
+
+def ensure_file_logging() -> logging.Logger:
+    """
+    Install the file and console handlers on the default logger.
+    
+    Safe to call more than once; only the first call does any work. Records
+    logged before the first call are discarded.
+    
+    Returns:
+        logging.Logger: The default logger
+    """
+    global _file_logging_ready
+    if not _file_logging_ready:
+        _file_logging_ready = True
+        setup_logger(level=logging.DEBUG if _debug_enabled else logging.INFO)
+    return logger
+
+def _set_handler_levels(target: logging.Logger, level: int) -> None:
+    target.setLevel(level)
+    for handler in target.handlers:
+        handler.setLevel(level)
+        # Also update the handlers behind a QueueHandler's listener, and the
+        # target of any buffering handler among them
+        listener = getattr(handler, 'listener', None)
+        if listener is not None:
+            for queued_handler in listener.handlers:
+                queued_handler.setLevel(level)
+                buffer_target = getattr(queued_handler, 'target', None)
+                if buffer_target is not None:
+                    buffer_target.setLevel(level)
 
 def set_log_level(level: int) -> None:
     """
@@ -103,17 +202,39 @@ def set_log_level(level: int) -> None:
     Args:
         level: The logging level to set (e.g., logging.DEBUG)
     """
-    logger.setLevel(level)
-    for handler in logger.handlers:
-        handler.setLevel(level)
+    global _debug_enabled
+    _set_handler_levels(logger, level)
+    _debug_enabled = level <= logging.DEBUG
 
-# Set debug level if environment variable is set
-if os.environ.get("POORMAN_DEBUG"):
-    set_log_level(logging.DEBUG)
+def is_debug_enabled() -> bool:
+    """Return True if DEBUG records from the default logger are emitted"""
+    return _debug_enabled
 
-__all__ = ['logger', 'set_log_level', 'setup_logger'] 
+__all__ = [
+    'logger', 'ensure_file_logging', 'set_log_level', 'setup_logger',
+    'is_debug_enabled',
+] 
 
 # --- Global exception hooks ---
+
+# Occurrence counts per (exception type, message prefix), used to back off
+# logging of repeated uncaught exceptions
+_exc_counts: Dict[Tuple[type, str], int] = {}
+
+def _next_occurrence(exc_type, exc_value) -> Tuple[int, bool]:
+    """
+    Count an occurrence of an uncaught exception.
+    
+    Returns:
+        Tuple of (occurrence count, whether to log it). Only occurrences
+        1, 2, 4, 8, ... are logged, so an exception raised in a tight loop
+        (e.g. a Tk callback) cannot flood the log.
+    """
+    key = (exc_type, str(exc_value)[:80])
+    count = _exc_counts.get(key, 0) + 1
+    _exc_counts[key] = count
+    return count, count & (count - 1) == 0
+
 def install_global_exception_hooks(root: Optional[object] = None) -> None:
     """Install global exception hooks to ensure all unhandled errors are logged.
 
@@ -123,7 +244,10 @@ def install_global_exception_hooks(root: Optional[object] = None) -> None:
         # Avoid logging KeyboardInterrupt tracebacks as errors
         if exc_type is KeyboardInterrupt:
             return
-        logger.error("Uncaught exception", exc_info=(exc_type, exc_value, exc_traceback))
+        count, should_log = _next_occurrence(exc_type, exc_value)
+        if should_log:
+            logger.error("Uncaught exception (occurrence %d)", count,
+                         exc_info=(exc_type, exc_value, exc_traceback))
 
     sys.excepthook = _excepthook
 
@@ -131,7 +255,10 @@ def install_global_exception_hooks(root: Optional[object] = None) -> None:
     if root is not None:
         try:
             def _tk_report_callback_exception(exc_type, exc_value, exc_traceback):
-                logger.error("Tkinter callback exception", exc_info=(exc_type, exc_value, exc_traceback))
+                count, should_log = _next_occurrence(exc_type, exc_value)
+                if should_log:
+                    logger.error("Tkinter callback exception (occurrence %d)", count,
+                                 exc_info=(exc_type, exc_value, exc_traceback))
             # Tkinter calls this on callback exceptions
             setattr(root, 'report_callback_exception', _tk_report_callback_exception)
         except Exception:
@@ -147,21 +274,24 @@ SENSITIVE_HEADER_KEYS = {
 
 SENSITIVE_SUBSTRINGS = {'token', 'secret', 'password', 'passwd', 'key'}
 
+# Matches a key that is exactly one of SENSITIVE_HEADER_KEYS or contains any
+# of SENSITIVE_SUBSTRINGS, case-insensitively, in a single regex search
+_RE_SENSITIVE = re.compile(
+    r'\A(?:' + '|'.join(map(re.escape, sorted(SENSITIVE_HEADER_KEYS))) + r')\Z'
+    r'|' + '|'.join(map(re.escape, sorted(SENSITIVE_SUBSTRINGS))),
+    re.IGNORECASE
+)
+
 def _should_redact(key: str) -> bool:
-    k = key.lower()
-    if k in SENSITIVE_HEADER_KEYS:
-        return True
-    return any(sub in k for sub in SENSITIVE_SUBSTRINGS)
+    return _RE_SENSITIVE.search(key) is not None
 
 def redact_headers(headers: dict) -> dict:
     """Return a copy of headers with sensitive values redacted."""
     try:
-        redacted = {}
-        for k, v in (headers or {}).items():
-            if _should_redact(str(k)):
-                redacted[k] = '<redacted>'
-            else:
-                redacted[k] = v
+        # Copy in one C-level pass, then overwrite only the sensitive entries
+        redacted = dict(headers or {})
+        for k in [k for k in redacted if _should_redact(str(k))]:
+            redacted[k] = '<redacted>'
         return redacted
     except Exception:
         # Never fail logging due to redaction issues
@@ -27,7 +27,8 @@ __keywords__ = ["rest", "api", "testing", "http", "client", "postman"]
 __requires__ = [
     "requests>=2.31.0",
     "requests-oauthlib>=1.3.1",
-    "urllib3>=2.0.7"
+    "urllib3>=2.0.7",
+    "orjson>=3.9.0"
 ]
 
 __all__ = [
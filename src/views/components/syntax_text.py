@@ -11,43 +11,101 @@ Currently supports JSON formatting with color highlighting.
 :license: Apache 2.0, see LICENSE for more details.
 """
 
+import functools
 import json
 import tkinter as tk
 from tkinter import ttk
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import re
+from bisect import bisect_right
 
 from utils.logging_config import logger
 
+# All JSON highlighting in one pattern: a key, or a value after its colon.
+# The named group that matched gives the tag via _JSON_GROUP_TAGS; the colon
+# and whitespace before a value are left untagged.
+_RE_JSON = re.compile(
+    r'(?P<key>"(?:[^"\\]|\\.)*")(?=:)'
+    r'|:\s*(?:'
+    r'(?P<string>"(?:[^"\\]|\\.)*")'
+    r'|(?P<number>-?\d+\.?\d*)'
+    r'|(?P<boolean>true|false)\b'
+    r'|(?P<null>null)\b'
+    r')'
+)
+
+_JSON_GROUP_TAGS = {
+    'key': 'string',
+    'string': 'string',
+    'number': 'number',
+    'boolean': 'boolean',
+    'null': 'null',
+}
+
+# Highlighting tags and their foreground colors, in parallel
+_JSON_TAGS = ('string', 'number', 'boolean', 'null', 'key', 'error')
+_JSON_COLORS = (
+    '#008000',  # Green
+    '#0000FF',  # Blue
+    '#FF00FF',  # Magenta
+    '#808080',  # Gray
+    '#000080',  # Navy
+    '#FF0000',  # Red
+)
+
+_RE_NEWLINE = re.compile('\n')
+
+def _line_starts(content: str, first_col: int = 0) -> List[int]:
+    """
+    Return the character offset at which each line of content starts.
+    
+    first_col is the column content starts at in the widget; the first
+    line's start is shifted back by it so columns come out right.
+    """
+    return [-first_col] + [m.end() for m in _RE_NEWLINE.finditer(content)]
+
+# Leading whitespace and the opening bracket of a JSON object or array
+_RE_JSON_START = re.compile(r'\s*[{\[]')
+
+def _to_index(line_starts: List[int], pos: int, first_line: int = 1) -> str:
+    """Convert a character offset into a Tk "line.column" text index"""
+    line = bisect_right(line_starts, pos) - 1
+    return f"{line + first_line}.{pos - line_starts[line]}"
+
+def _writes(method):
+    """Make the (normally disabled) widget editable for the duration of method"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        previous = str(self.cget("state"))
+        self.config(state=tk.NORMAL)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.config(state=previous)
+    return wrapper
+
 class SyntaxText(tk.Text):
     """
     A text widget that supports syntax highlighting.
-    Currently supports JSON formatting with color highlighting.
-    
-    Attributes:
-        json_colors (dict): Color configuration for JSON syntax highlighting
+    Currently supports JSON formatting with color highlighting; tag colors
+    are set by _JSON_TAGS and _JSON_COLORS.
     """
     
     def __init__(self, *args, **kwargs):
         """Initialize the syntax highlighting text widget."""
         super().__init__(*args, **kwargs)
         
-        # Configure tags for syntax highlighting
-        self.json_colors = {
-            'string': '#008000',  # Green
-            'number': '#0000FF',  # Blue
-            'boolean': '#FF00FF', # Magenta
-            'null': '#808080',    # Gray
-            'key': '#000080',     # Navy
-            'error': '#FF0000'    # Red
-        }
-        
         # Create tags with their colors
-        for tag, color in self.json_colors.items():
+        for tag, color in zip(_JSON_TAGS, _JSON_COLORS):
             self.tag_configure(tag, foreground=color)
         
-        # Make the widget read-only
-        self.bind("<Key>", self._readonly)
+        # Make the widget read-only; Tk still allows selecting and copying
+        # from a disabled text widget. Content is written through methods
+        # decorated with _writes.
+        self.config(state=tk.DISABLED)
+        # A disabled text widget does not take focus on click, which copy
+        # shortcuts need
+        self.bind("<Button-1>", lambda event: self.focus_set())
         
         # Enable horizontal scrolling
         self.config(wrap=tk.NONE)
@@ -55,23 +113,35 @@ class SyntaxText(tk.Text):
         # Configure tab size (8 spaces)
         self.config(tabs=('8c'))
     
-    def _readonly(self, event):
-        """Make the widget read-only except for copy operations."""
-        return "break" if event.keysym not in ("c", "C", "Copy") else None
-    
+    @_writes
     def clear(self):
         """Clear all text from the widget."""
         self.delete("1.0", tk.END)
     
-    def highlight_json(self, text: str) -> None:
+    @_writes
+    def highlight_json(self, text: Any, formatted: bool = False) -> bool:
         """
         Display and highlight JSON text.
         
         Args:
-            text (str): The JSON text to highlight
+            text: The JSON text to highlight (str or bytes), or an already
+                parsed JSON value
+            formatted (bool): text is known to be pretty-printed JSON (or
+                the start of it), so it is shown as-is without parsing
+        
+        Returns:
+            bool: True if the text was shown highlighted, False if it could
+                not be formatted and was shown as-is
         """
         self.clear()
         
+        # Text that is already pretty-printed (e.g. formatted by the response
+        # panel) is shown as-is instead of being parsed and dumped again
+        if formatted and isinstance(text, str):
+            self.insert("1.0", text)
+            self._highlight_json_syntax(text)
+            return True
+        
         try:
             # Parse and reformat the JSON
             if isinstance(text, (str, bytes)):
@@ -88,89 +158,110 @@ class SyntaxText(tk.Text):
             self.insert("1.0", formatted)
             
             # Apply syntax highlighting
-            self._highlight_json_syntax()
+            self._highlight_json_syntax(formatted)
+            return True
             
         except json.JSONDecodeError as e:
-            logger.error(f"JSON parsing error: {e}")
+            logger.error("JSON parsing error: %s", e)
             # Show raw text with error message
             self.insert("1.0", f"Error parsing JSON: {e}\n\nRaw content:\n{text}")
             self.tag_add("error", "1.0", "2.0")
         except Exception as e:
-            logger.error(f"Error formatting JSON: {e}")
+            logger.error("Error formatting JSON: %s", e)
             self.insert("1.0", str(text))
+        return False
     
-    def _highlight_json_syntax(self):
-        """Apply JSON syntax highlighting to the current content."""
+    def _highlight_json_syntax(self, content: Optional[str] = None):
+        """
+        Apply JSON syntax highlighting to the current content.
+        
+        Args:
+            content (str, optional): The widget's text, when the caller just
+                inserted it; avoids copying the buffer back out of Tk
+        """
         # Remove any existing tags
-        for tag in self.json_colors:
+        for tag in _JSON_TAGS:
             self.tag_remove(tag, "1.0", tk.END)
         
-        content = self.get("1.0", tk.END)
+        if content is None:
+            content = self.get("1.0", tk.END)
+        self._tag_json(content)
+    
+    def _tag_json(self, content: str, first_line: int = 1, first_col: int = 0):
+        """Highlight content, which sits in the widget from first_line.first_col"""
+        line_starts = _line_starts(content, first_col)
         
-        # Define regex patterns for JSON elements
-        patterns = {
-            'string': r'"(?:[^"\\]|\\.)*"(?=:)',  # Keys
-            'value_string': r':\s*"(?:[^"\\]|\\.)*"',  # String values
-            'number': r':\s*-?\d+\.?\d*',  # Numbers
-            'boolean': r':\s*(true|false)\b',  # Booleans
-            'null': r':\s*null\b'  # Null values
-        }
+        # Collect ranges per tag in a single pass over the text, converting
+        # character positions to text widget indices
+        ranges = {tag: [] for tag in set(_JSON_GROUP_TAGS.values())}
+        for match in _RE_JSON.finditer(content):
+            group = match.lastgroup
+            start, end = match.span(group)
+            ranges[_JSON_GROUP_TAGS[group]] += (
+                _to_index(line_starts, start, first_line),
+                _to_index(line_starts, end, first_line)
+            )
         
-        # Apply highlighting
-        for tag, pattern in patterns.items():
-            self._highlight_pattern(pattern, tag if tag != 'value_string' else 'string')
+        # Apply highlighting with one Tcl call per tag
+        for tag, indices in ranges.items():
+            if indices:
+                self.tag_add(tag, *indices)
     
-    def _highlight_pattern(self, pattern: str, tag: str):
+    @_writes
+    def append(self, text: str, highlight: bool = False) -> None:
         """
-        Apply a tag to all text that matches the pattern.
+        Add text at the end of the widget.
         
         Args:
-            pattern (str): Regular expression pattern to match
-            tag (str): Tag to apply to matched text
+            text (str): The text to add
+            highlight (bool): Apply JSON highlighting to the added text only
         """
-        content = self.get("1.0", tk.END)
-        
-        for match in re.finditer(pattern, content):
-            start = match.start()
-            end = match.end()
-            
-            # For value patterns, adjust start to skip the colon and whitespace
-            if pattern.startswith(':\\s*'):
-                start = start + len(re.match(r':\s*', match.group()).group())
-            
-            # Convert character positions to text widget indices
-            start_line = content.count('\n', 0, start) + 1
-            start_char = start - content.rfind('\n', 0, start) - 1
-            end_line = content.count('\n', 0, end) + 1
-            end_char = end - content.rfind('\n', 0, end) - 1
-            
-            self.tag_add(tag, f"{start_line}.{start_char}", f"{end_line}.{end_char}")
+        line, col = map(int, self.index("end-1c").split("."))
+        self.insert(tk.END, text)
+        if highlight:
+            self._tag_json(text, line, col)
     
-    def set_content(self, content: str, content_type: Optional[str] = None):
+    @_writes
+    def set_content(self, content: str, content_type: Optional[str] = None,
+                    formatted: bool = False) -> bool:
         """
         Set the widget content with appropriate formatting.
         
         Args:
             content (str): The content to display
             content_type (str, optional): Content type for formatting selection
+            formatted (bool): With a JSON content type, content is already
+                pretty-printed and is highlighted without being parsed
+        
+        Returns:
+            bool: True if the content was shown as highlighted JSON
         """
         self.clear()
         
+        is_json = False
         if content_type and 'json' in content_type.lower():
-            self.highlight_json(content)
+            is_json = self.highlight_json(content, formatted)
         else:
-            try:
-                # Try to parse as JSON even if content-type is not specified
-                json.loads(content if isinstance(content, str) else content.decode('utf-8'))
-                self.highlight_json(content)
-            except (json.JSONDecodeError, UnicodeDecodeError):
+            if isinstance(content, bytes):
+                try:
+                    content = content.decode('utf-8')
+                except UnicodeDecodeError:
+                    content = str(content)
+            # Try to treat it as JSON even if content-type is not specified,
+            # but only parse text that starts like an object or array, and
+            # hand the parsed value on so it is not parsed a second time
+            parsed = None
+            if _RE_JSON_START.match(content):
+                try:
+                    parsed = json.loads(content)
+                except json.JSONDecodeError:
+                    pass
+            if parsed is not None:
+                is_json = self.highlight_json(parsed)
+            else:
                 # If not JSON, display as plain text
-                if isinstance(content, bytes):
-                    try:
-                        content = content.decode('utf-8')
-                    except UnicodeDecodeError:
-                        content = str(content)
                 self.insert("1.0", content)
         
         # Reset view to top
-        self.see("1.0") 
\ No newline at end of file
+        self.see("1.0")
+        return is_json 
\ No newline at end of file
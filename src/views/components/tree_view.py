@@ -1,11 +1,17 @@
 import tkinter as tk
 from tkinter import ttk
-from typing import List, Tuple, Optional, Callable
+from typing import Dict, List, Tuple, Optional, Callable
 
 class EditableTreeView:
-    def __init__(self, parent: ttk.Frame, columns: List[str], title: str = ""):
-        """Initialize an editable tree view with add/remove buttons"""
+    def __init__(self, parent: ttk.Frame, columns: List[str], title: str = "",
+                 on_change: Optional[Callable[[], None]] = None):
+        """
+        Initialize an editable tree view with add/remove buttons.
+        
+        on_change, if given, is called after every change to the items.
+        """
         self.parent = parent
+        self.on_change = on_change
         
         # Create container frame
         self.frame = ttk.LabelFrame(parent, text=title, padding="5")
@@ -57,6 +63,7 @@ class EditableTreeView:
             values = [var.get() for var in entries]
             if values[0].strip():  # Check if key is not empty
                 self.tree.insert("", tk.END, values=values)
+                self._changed()
                 dialog.destroy()
         
         ttk.Button(dialog, text="Add", command=save_item).grid(row=len(entries), column=0, padx=10, pady=10)
@@ -67,17 +74,40 @@ class EditableTreeView:
         selected = self.tree.selection()
         if selected:
             self.tree.delete(selected[0])
+            self._changed()
     
     def get_items(self) -> List[Tuple[str, ...]]:
         """Get all items in the tree view"""
         return [self.tree.item(item)["values"] for item in self.tree.get_children()]
     
+    def get_items_dict(self) -> Dict[str, str]:
+        """Get {key: value} from the first two columns, skipping empty keys"""
+        # Read rows with raw Tcl calls: item() converts numeric-looking
+        # values to int, and builds a dict of every option for each row
+        call, widget, splitlist = self.tree.tk.call, self.tree._w, self.tree.tk.splitlist
+        items = {}
+        for item in splitlist(call(widget, "children", "")):
+            key, value, *_ = map(str, splitlist(call(widget, "item", item, "-values")))
+            if key:
+                items[key] = value
+        return items
+    
     def clear(self):
         """Remove all items"""
         for item in self.tree.get_children():
             self.tree.delete(item)
+        self._changed()
     
     def add_items(self, items: List[Tuple[str, ...]]):
         """Add multiple items to the tree view"""
+        # Call the Tcl insert command directly: Treeview.insert() re-parses
+        # its keyword options into Tcl arguments for every row
+        call, widget = self.tree.tk.call, self.tree._w
         for item in items:
-            self.tree.insert("", tk.END, values=item) 
\ No newline at end of file
+            call(widget, "insert", "", tk.END, "-values", item)
+        self._changed()
+    
+    def _changed(self):
+        """Notify the on_change callback, if any"""
+        if self.on_change is not None:
+            self.on_change()
@@ -37,12 +37,18 @@ from models.response_model import ResponseModel
 from controllers.request_controller import RequestController
 from views.request_panel import RequestPanel
 from views.response_panel import ResponsePanel
-from utils.logging_config import logger, redact_headers
+from utils.logging_config import (
+    logger, ensure_file_logging, redact_headers, is_debug_enabled
+)
 from version import (
     __title__, __description__, __version__, __author__,
     __license__, __copyright__, __website__, __status__
 )
 
+# Fixed strings for the window title and About dialog
+_ABOUT_TITLE = f"{__title__} v{__version__}"
+_ABOUT_LICENSE = f"{__copyright__}\nLicensed under {__license__}"
+
 class MainWindow:
     """
     Main application window class that manages the overall UI layout and interactions.
@@ -69,11 +75,14 @@ class MainWindow:
         Args:
             root (tk.Tk): The root window instance for the application
         """
+        ensure_file_logging()
         logger.info("Initializing main window")
         self.root = root
+        # About dialog, created on first open (see show_about_dialog)
+        self._about_window: Optional[tk.Toplevel] = None
         
         # Configure window
-        self.root.title(f"{__title__} v{__version__}")
+        self.root.title(_ABOUT_TITLE)
         self.root.minsize(800, 600)  # Set minimum window size
         self.root.geometry("1200x800")  # Set default size
         
@@ -89,7 +98,7 @@ class MainWindow:
         
         # Initialize controller
         logger.debug("Initializing request controller")
-        self.request_controller = RequestController(self.on_response_received)
+        self.request_controller = RequestController(self.root, self.on_response_received)
         
         # Create request panel
         logger.debug("Creating request panel")
@@ -137,15 +146,38 @@ class MainWindow:
     def show_about_dialog(self):
         """Display the About dialog with application information."""
         logger.debug("Showing About dialog")
+        # The dialog is built once and hidden on close; later opens only
+        # reposition and show it again
+        if self._about_window is None:
+            self._about_window = self._create_about_window()
+        about_window = self._about_window
+        
+        # Center the window
+        about_window.geometry(f"+{self.root.winfo_x() + 150}+{self.root.winfo_y() + 150}")
+        about_window.deiconify()
+        about_window.lift()
+        about_window.grab_set()
+    
+    def _hide_about_dialog(self):
+        """Hide the About dialog, keeping it for the next open."""
+        self._about_window.grab_release()
+        self._about_window.withdraw()
+    
+    def _on_about_destroyed(self, event):
+        """Forget the cached About dialog once its window is destroyed."""
+        if event.widget is self._about_window:
+            self._about_window = None
+    
+    def _create_about_window(self) -> tk.Toplevel:
+        """Build the (initially hidden) About dialog."""
         about_window = tk.Toplevel(self.root)
+        about_window.withdraw()
         about_window.title(f"About {__title__}")
         about_window.geometry("500x400")
         about_window.resizable(False, False)
         about_window.transient(self.root)
-        about_window.grab_set()
-        
-        # Center the window
-        about_window.geometry(f"+{self.root.winfo_x() + 150}+{self.root.winfo_y() + 150}")
+        about_window.protocol("WM_DELETE_WINDOW", self._hide_about_dialog)
+        about_window.bind("<Destroy>", self._on_about_destroyed)
         
         # Create a frame with padding
         frame = ttk.Frame(about_window, padding="20")
@@ -154,7 +186,7 @@ class MainWindow:
         # Application name and version (larger font)
         name_label = ttk.Label(
             frame,
-            text=f"{__title__} v{__version__}",
+            text=_ABOUT_TITLE,
             font=("Helvetica", 16, "bold")
         )
         name_label.pack(pady=(0, 10))
@@ -187,7 +219,7 @@ class MainWindow:
         # License info
         license_label = ttk.Label(
             frame,
-            text=__copyright__ + "\n" + f"Licensed under {__license__}",
+            text=_ABOUT_LICENSE,
             justify=tk.CENTER
         )
         license_label.pack(pady=(20, 0))
@@ -206,8 +238,10 @@ class MainWindow:
         ttk.Button(
             frame,
             text="Close",
-            command=about_window.destroy
+            command=self._hide_about_dialog
         ).pack(pady=(20, 0))
+        
+        return about_window
     
     def on_send_request(self, request: RequestModel):
         """
@@ -216,20 +250,22 @@ class MainWindow:
         Args:
             request (RequestModel): The request to be sent
         """
-        logger.info(f"Sending {request.method} request to {request.url}")
-        try:
-            safe_details = {
-                'method': request.method,
-                'url': request.url,
-                'params': list(request.params.keys()),
-                'headers': list(redact_headers(request.headers).items()),
-                'body_type': request.body_type,
-                'body_size': len(request.body_content or '') if request.body_type in ['raw', 'json'] else len(request.form_data or {}),
-                'auth_type': request.auth_type,
-            }
-            logger.debug(f"Request details: {safe_details}")
-        except Exception:
-            logger.debug("Failed to log request details safely", exc_info=True)
+        logger.info("Sending %s request to %s", request.method, request.url)
+        # Only build the (redacted) details when they will actually be logged
+        if is_debug_enabled():
+            try:
+                safe_details = {
+                    'method': request.method,
+                    'url': request.url,
+                    'params': list(request.params.keys()),
+                    'headers': list(redact_headers(request.headers).items()),
+                    'body_type': request.body_type,
+                    'body_size': len(request.body_content or '') if request.body_type in ['raw', 'json'] else len(request.form_data or {}),
+                    'auth_type': request.auth_type,
+                }
+                logger.debug("Request details: %s", safe_details)
+            except Exception:
+                logger.debug("Failed to log request details safely", exc_info=True)
         self.status_bar.config(text="Sending request...")
         self.request_controller.send_request(request)
     
@@ -240,8 +276,9 @@ class MainWindow:
         Args:
             response (ResponseModel): The response received from the request
         """
-        logger.info(f"Received response with status code: {response.status_code}")
-        logger.debug(f"Response details: {response}")
+        logger.info("Received response with status code: %d", response.status_code)
+        if is_debug_enabled():
+            logger.debug("Response details: %s", response)
         self.response_panel.display_response(response)
         if response.is_success:
             self.status_bar.config(text="Request completed")
@@ -260,7 +297,7 @@ class MainWindow:
             title="Save Request"
         )
         if file_path:
-            logger.info(f"Saving request to file: {file_path}")
+            logger.info("Saving request to file: %s", file_path)
             request = self.request_panel.get_request()
             self.request_controller.save_request(request, file_path)
             self.status_bar.config(text=f"Request saved to {file_path}")
@@ -273,7 +310,7 @@ class MainWindow:
             title="Load Request"
         )
         if file_path:
-            logger.info(f"Loading request from file: {file_path}")
+            logger.info("Loading request from file: %s", file_path)
             request = self.request_controller.load_request(file_path)
             if request:
                 self.request_panel.set_request(request)
@@ -284,4 +321,5 @@ class MainWindow:
         logger.debug("Application closing requested")
         if messagebox.askokcancel("Quit", "Do you want to quit?"):
             logger.info("Application shutting down")
+            self.request_controller.shutdown()
             self.root.destroy() 
\ No newline at end of file
@@ -1,15 +1,37 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Callable, Dict
+from typing import Callable, Dict, List, Optional, Tuple
 
 from models.request_model import RequestModel
 from views.components.tree_view import EditableTreeView
 
+# OAuth fields as (label, auth_data key, variable name)
+_OAUTH1_FIELDS = (
+    ("Consumer Key:", "consumer_key", "oauth1_consumer_key"),
+    ("Consumer Secret:", "consumer_secret", "oauth1_consumer_secret"),
+    ("Access Token:", "access_token", "oauth1_access_token"),
+    ("Token Secret:", "token_secret", "oauth1_token_secret"),
+)
+
+_OAUTH2_FIELDS = (
+    ("Client ID:", "client_id", "oauth2_client_id"),
+    ("Client Secret:", "client_secret", "oauth2_client_secret"),
+    ("Access Token URL:", "token_url", "oauth2_token_url"),
+    ("Authorization URL:", "auth_url", "oauth2_auth_url"),
+    ("Redirect URI:", "redirect_uri", "oauth2_redirect_uri"),
+    ("Scope:", "scope", "oauth2_scope"),
+)
+
 class RequestPanel:
     def __init__(self, parent: ttk.Frame, on_send: Callable[[RequestModel], None]):
         self.parent = parent
         self.on_send = on_send
         self.request_controller = None  # Will be set by MainWindow
+        self._oauth2_token_dialog: Optional[tk.Toplevel] = None  # Built on first use
+        
+        # get_request() result, reused until a field changes
+        self._cached_request: Optional[RequestModel] = None
+        self._request_dirty = True
         
         # Create main frame
         self.frame = ttk.LabelFrame(parent, text="Request", padding="5")
@@ -20,7 +42,7 @@ class RequestPanel:
         
         # HTTP Method dropdown
         ttk.Label(url_frame, text="Method:").pack(side=tk.LEFT, padx=(0, 5))
-        self.method_var = tk.StringVar(value="GET")
+        self.method_var = self._traced(tk.StringVar(value="GET"))
         method_combo = ttk.Combobox(url_frame, textvariable=self.method_var, 
                                   values=["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"],
                                   state="readonly", width=10)
@@ -28,7 +50,7 @@ class RequestPanel:
         
         # URL Entry
         ttk.Label(url_frame, text="URL:").pack(side=tk.LEFT, padx=(0, 5))
-        self.url_var = tk.StringVar()
+        self.url_var = self._traced(tk.StringVar())
         url_entry = ttk.Entry(url_frame, textvariable=self.url_var, width=50)
         url_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
         
@@ -41,12 +63,14 @@ class RequestPanel:
         
         # Parameters tab
         params_frame = ttk.Frame(notebook)
-        self.params_tree = EditableTreeView(params_frame, ["Key", "Value", "Description"], "Parameter")
+        self.params_tree = EditableTreeView(params_frame, ["Key", "Value", "Description"], "Parameter",
+                                            on_change=self._invalidate)
         notebook.add(params_frame, text="Params")
         
         # Headers tab
         headers_frame = ttk.Frame(notebook)
-        self.headers_tree = EditableTreeView(headers_frame, ["Key", "Value", "Description"], "Header")
+        self.headers_tree = EditableTreeView(headers_frame, ["Key", "Value", "Description"], "Header",
+                                             on_change=self._invalidate)
         notebook.add(headers_frame, text="Headers")
         
         # Body tab
@@ -59,6 +83,21 @@ class RequestPanel:
         self.create_auth_tab(auth_frame)
         notebook.add(auth_frame, text="Auth")
     
+    def _invalidate(self, *args):
+        """Mark the cached get_request() result as stale"""
+        self._request_dirty = True
+    
+    def _traced(self, var: tk.StringVar) -> tk.StringVar:
+        """Invalidate the cached request whenever var is written"""
+        var.trace_add("write", self._invalidate)
+        return var
+    
+    def _on_body_modified(self, event):
+        """Invalidate the cached request when the body text is edited"""
+        self._request_dirty = True
+        # <<Modified>> only fires when the flag is set, so clear it again
+        event.widget.edit_modified(False)
+    
     def create_body_tab(self, parent: ttk.Frame):
         """Create the body configuration tab"""
         # Body type selection
@@ -67,7 +106,7 @@ class RequestPanel:
         
         ttk.Label(type_frame, text="Body Type:").pack(side=tk.LEFT, padx=(0, 10))
         
-        self.body_type_var = tk.StringVar(value="none")
+        self.body_type_var = self._traced(tk.StringVar(value="none"))
         body_types = [("None", "none"), ("Raw", "raw"), ("Form Data", "form"), ("JSON", "json")]
         
         for text, value in body_types:
@@ -78,11 +117,12 @@ class RequestPanel:
         self.body_content_frame = ttk.Frame(parent)
         self.body_content_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        # Raw/JSON text area
-        self.body_text = tk.Text(self.body_content_frame, height=10, wrap=tk.WORD)
-        
-        # Form data tree view
-        self.form_tree = EditableTreeView(self.body_content_frame, ["Key", "Value", "Type"], "Form Field")
+        # The raw/JSON text area ("text") and form data tree view ("form") are
+        # created the first time a body type that needs them is selected
+        self._body_widgets = {}
+        # The body type last shown, and the widget packed for it
+        self._current_body_type: Optional[str] = None
+        self._current_body_widget: Optional[tk.Widget] = None
         
         self.on_body_type_change()
     
@@ -94,7 +134,7 @@ class RequestPanel:
         
         ttk.Label(type_frame, text="Auth Type:").pack(side=tk.LEFT, padx=(0, 10))
         
-        self.auth_type_var = tk.StringVar(value="none")
+        self.auth_type_var = self._traced(tk.StringVar(value="none"))
         auth_types = [("None", "none"), ("Basic Auth", "basic"), ("Bearer Token", "bearer"),
                      ("OAuth 1.0", "oauth1"), ("OAuth 2.0", "oauth2")]
         
@@ -106,159 +146,202 @@ class RequestPanel:
         self.auth_content_frame = ttk.Frame(parent)
         self.auth_content_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        # Basic Auth frame
-        self.basic_auth_frame = ttk.LabelFrame(self.auth_content_frame, text="Basic Authentication", padding="10")
-        self.basic_username_var = tk.StringVar()
-        self.basic_password_var = tk.StringVar()
+        # Auth frames are built the first time their type is selected
+        self._auth_builders = {
+            "basic": self._build_basic_auth,
+            "bearer": self._build_bearer_auth,
+            "oauth1": self._build_oauth1,
+            "oauth2": self._build_oauth2,
+        }
+        self._auth_frames: Dict[str, ttk.LabelFrame] = {}
+        # (auth_data key, variable) pairs for each built auth frame
+        self._auth_fields: Dict[str, Tuple[Tuple[str, tk.StringVar], ...]] = {}
+        # The auth type last shown, and its packed frame
+        self._current_auth_type: Optional[str] = None
+        self._current_auth_frame: Optional[ttk.LabelFrame] = None
         
-        ttk.Label(self.basic_auth_frame, text="Username:").grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
-        ttk.Entry(self.basic_auth_frame, textvariable=self.basic_username_var).grid(row=0, column=1, sticky=tk.W, pady=(0, 5))
+        self.on_auth_type_change()
+    
+    def _get_auth_frame(self, auth_type: str) -> Optional[ttk.LabelFrame]:
+        """Return the frame for auth_type, building it on first use"""
+        frame = self._auth_frames.get(auth_type)
+        if frame is None and auth_type in self._auth_builders:
+            frame = self._auth_frames[auth_type] = self._auth_builders[auth_type]()
+        return frame
+    
+    def _build_basic_auth(self) -> ttk.LabelFrame:
+        """Create the Basic Auth frame and its variables"""
+        frame = ttk.LabelFrame(self.auth_content_frame, text="Basic Authentication", padding="10")
+        self.basic_username_var = self._traced(tk.StringVar())
+        self.basic_password_var = self._traced(tk.StringVar())
         
-        ttk.Label(self.basic_auth_frame, text="Password:").grid(row=1, column=0, sticky=tk.W)
-        ttk.Entry(self.basic_auth_frame, textvariable=self.basic_password_var, show="*").grid(row=1, column=1, sticky=tk.W)
+        ttk.Label(frame, text="Username:").grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
+        ttk.Entry(frame, textvariable=self.basic_username_var).grid(row=0, column=1, sticky=tk.W, pady=(0, 5))
         
-        # Bearer Token frame
-        self.bearer_auth_frame = ttk.LabelFrame(self.auth_content_frame, text="Bearer Token", padding="10")
-        self.bearer_token_var = tk.StringVar()
+        ttk.Label(frame, text="Password:").grid(row=1, column=0, sticky=tk.W)
+        ttk.Entry(frame, textvariable=self.basic_password_var, show="*").grid(row=1, column=1, sticky=tk.W)
         
-        ttk.Label(self.bearer_auth_frame, text="Token:").grid(row=0, column=0, sticky=tk.W)
-        ttk.Entry(self.bearer_auth_frame, textvariable=self.bearer_token_var, width=50).grid(row=0, column=1, sticky=tk.W)
+        self._auth_fields["basic"] = (
+            ("username", self.basic_username_var),
+            ("password", self.basic_password_var),
+        )
+        return frame
+    
+    def _build_bearer_auth(self) -> ttk.LabelFrame:
+        """Create the Bearer Token frame and its variable"""
+        frame = ttk.LabelFrame(self.auth_content_frame, text="Bearer Token", padding="10")
+        self.bearer_token_var = self._traced(tk.StringVar())
         
-        # OAuth 1.0 frame
-        self.oauth1_frame = ttk.LabelFrame(self.auth_content_frame, text="OAuth 1.0", padding="10")
+        ttk.Label(frame, text="Token:").grid(row=0, column=0, sticky=tk.W)
+        ttk.Entry(frame, textvariable=self.bearer_token_var, width=50).grid(row=0, column=1, sticky=tk.W)
+        
+        self._auth_fields["bearer"] = (("token", self.bearer_token_var),)
+        return frame
+    
+    def _build_oauth1(self) -> ttk.LabelFrame:
+        """Create the OAuth 1.0 frame and its variables"""
+        frame = ttk.LabelFrame(self.auth_content_frame, text="OAuth 1.0", padding="10")
         self.oauth1_vars = {}
         
-        oauth1_fields = [
-            ("Consumer Key:", "oauth1_consumer_key"),
-            ("Consumer Secret:", "oauth1_consumer_secret"),
-            ("Access Token:", "oauth1_access_token"),
-            ("Token Secret:", "oauth1_token_secret")
-        ]
-        
-        for i, (label, var_name) in enumerate(oauth1_fields):
-            ttk.Label(self.oauth1_frame, text=label).grid(row=i, column=0, sticky=tk.W, pady=(0, 5))
-            self.oauth1_vars[var_name] = tk.StringVar()
-            ttk.Entry(self.oauth1_frame, textvariable=self.oauth1_vars[var_name], width=40).grid(
+        for i, (label, _, var_name) in enumerate(_OAUTH1_FIELDS):
+            ttk.Label(frame, text=label).grid(row=i, column=0, sticky=tk.W, pady=(0, 5))
+            self.oauth1_vars[var_name] = self._traced(tk.StringVar())
+            ttk.Entry(frame, textvariable=self.oauth1_vars[var_name], width=40).grid(
                 row=i, column=1, sticky=(tk.W, tk.E), pady=(0, 5))
         
-        # OAuth 2.0 frame
-        self.oauth2_frame = ttk.LabelFrame(self.auth_content_frame, text="OAuth 2.0", padding="10")
+        self._auth_fields["oauth1"] = tuple(
+            (key, self.oauth1_vars[var_name]) for _, key, var_name in _OAUTH1_FIELDS
+        )
+        return frame
+    
+    def _build_oauth2(self) -> ttk.LabelFrame:
+        """Create the OAuth 2.0 frame, its variables and buttons"""
+        frame = ttk.LabelFrame(self.auth_content_frame, text="OAuth 2.0", padding="10")
         self.oauth2_vars = {}
         
-        oauth2_fields = [
-            ("Client ID:", "oauth2_client_id"),
-            ("Client Secret:", "oauth2_client_secret"),
-            ("Access Token URL:", "oauth2_token_url"),
-            ("Authorization URL:", "oauth2_auth_url"),
-            ("Redirect URI:", "oauth2_redirect_uri"),
-            ("Scope:", "oauth2_scope")
-        ]
-        
-        for i, (label, var_name) in enumerate(oauth2_fields):
-            ttk.Label(self.oauth2_frame, text=label).grid(row=i, column=0, sticky=tk.W, pady=(0, 5))
-            self.oauth2_vars[var_name] = tk.StringVar()
-            ttk.Entry(self.oauth2_frame, textvariable=self.oauth2_vars[var_name], width=40).grid(
+        for i, (label, _, var_name) in enumerate(_OAUTH2_FIELDS):
+            ttk.Label(frame, text=label).grid(row=i, column=0, sticky=tk.W, pady=(0, 5))
+            self.oauth2_vars[var_name] = self._traced(tk.StringVar())
+            ttk.Entry(frame, textvariable=self.oauth2_vars[var_name], width=40).grid(
                 row=i, column=1, sticky=(tk.W, tk.E), pady=(0, 5))
         
+        self._auth_fields["oauth2"] = tuple(
+            (key, self.oauth2_vars[var_name]) for _, key, var_name in _OAUTH2_FIELDS
+        )
+        
         # OAuth 2.0 buttons
-        oauth2_btn_frame = ttk.Frame(self.oauth2_frame)
-        oauth2_btn_frame.grid(row=len(oauth2_fields), column=0, columnspan=2, pady=(10, 0))
+        oauth2_btn_frame = ttk.Frame(frame)
+        oauth2_btn_frame.grid(row=len(_OAUTH2_FIELDS), column=0, columnspan=2, pady=(10, 0))
         
         ttk.Button(oauth2_btn_frame, text="Get Authorization URL", 
                   command=self.on_get_oauth2_auth_url).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(oauth2_btn_frame, text="Get Access Token", 
                   command=self.on_get_oauth2_token).pack(side=tk.LEFT)
-        
-        self.on_auth_type_change()
+        return frame
+    
+    def _get_body_text(self) -> tk.Text:
+        """Return the raw/JSON body text area, creating it on first use"""
+        body_text = self._body_widgets.get("text")
+        if body_text is None:
+            body_text = tk.Text(self.body_content_frame, height=10, wrap=tk.WORD)
+            body_text.bind("<<Modified>>", self._on_body_modified)
+            self._body_widgets["text"] = body_text
+        return body_text
+    
+    def _get_form_tree(self) -> EditableTreeView:
+        """Return the form data tree view, creating it on first use"""
+        form_tree = self._body_widgets.get("form")
+        if form_tree is None:
+            # Give the tree view its own container so its buttons are shown
+            # and hidden along with it
+            container = ttk.Frame(self.body_content_frame)
+            form_tree = EditableTreeView(container, ["Key", "Value", "Type"], "Form Field",
+                                         on_change=self._invalidate)
+            self._body_widgets["form"] = form_tree
+        return form_tree
     
     def on_body_type_change(self):
         """Handle body type change"""
-        for widget in self.body_content_frame.winfo_children():
-            widget.pack_forget()
-        
         body_type = self.body_type_var.get()
+        if body_type == self._current_body_type:
+            return
+        self._current_body_type = body_type
+        
+        widget = None
         if body_type in ["raw", "json"]:
-            self.body_text.pack(fill=tk.BOTH, expand=True)
+            widget = self._get_body_text()
         elif body_type == "form":
-            self.form_tree.frame.pack(fill=tk.BOTH, expand=True)
+            widget = self._get_form_tree().parent
+        
+        # Raw and JSON share the text area, which can then stay packed
+        if widget is not self._current_body_widget:
+            if self._current_body_widget is not None:
+                self._current_body_widget.pack_forget()
+            if widget is not None:
+                widget.pack(fill=tk.BOTH, expand=True)
+            self._current_body_widget = widget
     
     def on_auth_type_change(self):
         """Handle authentication type change"""
-        for widget in self.auth_content_frame.winfo_children():
-            widget.pack_forget()
-        
         auth_type = self.auth_type_var.get()
-        if auth_type == "basic":
-            self.basic_auth_frame.pack(fill=tk.X)
-        elif auth_type == "bearer":
-            self.bearer_auth_frame.pack(fill=tk.X)
-        elif auth_type == "oauth1":
-            self.oauth1_frame.pack(fill=tk.X)
-        elif auth_type == "oauth2":
-            self.oauth2_frame.pack(fill=tk.X)
+        if auth_type == self._current_auth_type:
+            return
+        self._current_auth_type = auth_type
+        
+        if self._current_auth_frame is not None:
+            self._current_auth_frame.pack_forget()
+        frame = self._get_auth_frame(auth_type)
+        if frame is not None:
+            frame.pack(fill=tk.X)
+        self._current_auth_frame = frame
     
     def on_send_click(self):
         """Handle send button click"""
         request = self.get_request()
         self.on_send(request)
     
+    def _batch_get(self, variables: List[tk.StringVar]) -> Tuple[str, ...]:
+        """Return the values of variables, read with a single Tcl call"""
+        script = "list " + " ".join(f"[set {{{var}}}]" for var in variables)
+        return self.frame.tk.splitlist(self.frame.tk.eval(script))
+    
     def get_request(self) -> RequestModel:
         """Get current request configuration"""
-        # Get parameters
-        params = {}
-        for key, value, _ in self.params_tree.get_items():
-            if key:
-                params[key] = value
-        
-        # Get headers
-        headers = {}
-        for key, value, _ in self.headers_tree.get_items():
-            if key:
-                headers[key] = value
+        if not self._request_dirty and self._cached_request is not None:
+            return self._cached_request
+        
+        # Get parameters and headers
+        params = self.params_tree.get_items_dict()
+        headers = self.headers_tree.get_items_dict()
+        
+        # Read the remaining fields in one Tcl call: the method, URL and body
+        # type, then the variables of the selected auth type
+        auth_type = self.auth_type_var.get()
+        self._get_auth_frame(auth_type)  # make sure its variables exist
+        auth_fields = self._auth_fields.get(auth_type, ())
+        method, url, body_type, *auth_values = self._batch_get(
+            [self.method_var, self.url_var, self.body_type_var]
+            + [var for _, var in auth_fields]
+        )
         
         # Get body data
-        body_type = self.body_type_var.get()
         body_content = ""
         form_data = {}
         
-        if body_type in ["raw", "json"]:
-            body_content = self.body_text.get("1.0", tk.END).strip()
-        elif body_type == "form":
-            for key, value, _ in self.form_tree.get_items():
-                if key:
-                    form_data[key] = value
+        # A body widget that was never created has no content
+        body_text = self._body_widgets.get("text")
+        form_tree = self._body_widgets.get("form")
+        if body_type in ["raw", "json"] and body_text is not None:
+            body_content = body_text.get("1.0", tk.END).strip()
+        elif body_type == "form" and form_tree is not None:
+            form_data = form_tree.get_items_dict()
         
         # Get auth data
-        auth_type = self.auth_type_var.get()
-        auth_data = {}
-        
-        if auth_type == "basic":
-            auth_data = {
-                "username": self.basic_username_var.get(),
-                "password": self.basic_password_var.get()
-            }
-        elif auth_type == "bearer":
-            auth_data = {"token": self.bearer_token_var.get()}
-        elif auth_type == "oauth1":
-            auth_data = {
-                "consumer_key": self.oauth1_vars["oauth1_consumer_key"].get(),
-                "consumer_secret": self.oauth1_vars["oauth1_consumer_secret"].get(),
-                "access_token": self.oauth1_vars["oauth1_access_token"].get(),
-                "token_secret": self.oauth1_vars["oauth1_token_secret"].get()
-            }
-        elif auth_type == "oauth2":
-            auth_data = {
-                "client_id": self.oauth2_vars["oauth2_client_id"].get(),
-                "client_secret": self.oauth2_vars["oauth2_client_secret"].get(),
-                "token_url": self.oauth2_vars["oauth2_token_url"].get(),
-                "auth_url": self.oauth2_vars["oauth2_auth_url"].get(),
-                "redirect_uri": self.oauth2_vars["oauth2_redirect_uri"].get(),
-                "scope": self.oauth2_vars["oauth2_scope"].get()
-            }
-        
-        return RequestModel(
-            method=self.method_var.get(),
-            url=self.url_var.get(),
+        auth_data = {key: value for (key, _), value in zip(auth_fields, auth_values)}
+        
+        self._cached_request = RequestModel(
+            method=method,
+            url=url,
             params=params,
             headers=headers,
             body_type=body_type,
@@ -267,33 +350,46 @@ class RequestPanel:
             auth_type=auth_type,
             auth_data=auth_data
         )
+        self._request_dirty = False
+        return self._cached_request
     
     def set_request(self, request: RequestModel):
         """Set request configuration"""
+        # Take the panel out of the grid while its widgets are repacked and
+        # refilled, so the window is laid out once when it is put back
+        gridded = self.frame.winfo_manager() == "grid"
+        if gridded:
+            self.frame.grid_remove()
+        try:
+            self._apply_request(request)
+        finally:
+            if gridded:
+                self.frame.grid()
+    
+    def _apply_request(self, request: RequestModel):
+        """Copy request into the panel's variables and widgets"""
         self.method_var.set(request.method)
         self.url_var.set(request.url)
         
         # Set parameters
         self.params_tree.clear()
-        for key, value in request.params.items():
-            self.params_tree.add_items([(key, value, "")])
+        self.params_tree.add_items([(key, value, "") for key, value in request.params.items()])
         
         # Set headers
         self.headers_tree.clear()
-        for key, value in request.headers.items():
-            self.headers_tree.add_items([(key, value, "")])
+        self.headers_tree.add_items([(key, value, "") for key, value in request.headers.items()])
         
         # Set body
         self.body_type_var.set(request.body_type)
         self.on_body_type_change()
         
         if request.body_type in ["raw", "json"]:
-            self.body_text.delete("1.0", tk.END)
-            self.body_text.insert("1.0", request.body_content)
+            # One Tcl command swaps the old body for the new one
+            self._get_body_text().replace("1.0", tk.END, request.body_content)
         elif request.body_type == "form":
-            self.form_tree.clear()
-            for key, value in request.form_data.items():
-                self.form_tree.add_items([(key, value, "text")])
+            form_tree = self._get_form_tree()
+            form_tree.clear()
+            form_tree.add_items([(key, value, "text") for key, value in request.form_data.items()])
         
         # Set auth
         self.auth_type_var.set(request.auth_type)
@@ -305,22 +401,10 @@ class RequestPanel:
         elif request.auth_type == "bearer":
             self.bearer_token_var.set(request.auth_data.get("token", ""))
         elif request.auth_type == "oauth1":
-            for key, var_name in [
-                ("consumer_key", "oauth1_consumer_key"),
-                ("consumer_secret", "oauth1_consumer_secret"),
-                ("access_token", "oauth1_access_token"),
-                ("token_secret", "oauth1_token_secret")
-            ]:
+            for _, key, var_name in _OAUTH1_FIELDS:
                 self.oauth1_vars[var_name].set(request.auth_data.get(key, ""))
         elif request.auth_type == "oauth2":
-            for key, var_name in [
-                ("client_id", "oauth2_client_id"),
-                ("client_secret", "oauth2_client_secret"),
-                ("token_url", "oauth2_token_url"),
-                ("auth_url", "oauth2_auth_url"),
-                ("redirect_uri", "oauth2_redirect_uri"),
-                ("scope", "oauth2_scope")
-            ]:
+            for _, key, var_name in _OAUTH2_FIELDS:
                 self.oauth2_vars[var_name].set(request.auth_data.get(key, ""))
     
     def on_get_oauth2_auth_url(self):
@@ -341,27 +425,50 @@ class RequestPanel:
     
     def on_get_oauth2_token(self):
         """Handle getting OAuth2 access token"""
+        # The dialog is built once and hidden between uses
+        if self._oauth2_token_dialog is None:
+            self._oauth2_token_dialog = self._create_oauth2_token_dialog()
+        self._oauth2_code_var.set("")
+        self._oauth2_token_dialog.deiconify()
+        self._oauth2_token_dialog.grab_set()
+    
+    def _create_oauth2_token_dialog(self) -> tk.Toplevel:
+        """Build the (initially hidden) authorization code dialog"""
         dialog = tk.Toplevel(self.parent)
+        dialog.withdraw()
         dialog.title("Enter Authorization Code")
         dialog.geometry("500x120")
         dialog.transient(self.parent)
-        dialog.grab_set()
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_oauth2_token_dialog)
+        dialog.bind("<Destroy>", self._on_oauth2_token_dialog_destroyed)
         
         ttk.Label(dialog, text="Authorization Code:").pack(pady=10)
-        code_var = tk.StringVar()
-        ttk.Entry(dialog, textvariable=code_var, width=60).pack(pady=5)
-        
-        def get_token():
-            code = code_var.get().strip()
-            if not code:
-                messagebox.showerror("Error", "Please enter authorization code")
-                return
-            
-            client_secret = self.oauth2_vars["oauth2_client_secret"].get()
-            token_url = self.oauth2_vars["oauth2_token_url"].get()
-            
-            if self.request_controller.get_oauth2_token(code, client_secret, token_url):
-                dialog.destroy()
-                messagebox.showinfo("Success", "Access token obtained successfully!")
-        
-        ttk.Button(dialog, text="Get Token", command=get_token).pack(pady=10) 
\ No newline at end of file
+        self._oauth2_code_var = tk.StringVar()
+        ttk.Entry(dialog, textvariable=self._oauth2_code_var, width=60).pack(pady=5)
+        
+        ttk.Button(dialog, text="Get Token", command=self._on_get_token).pack(pady=10)
+        return dialog
+    
+    def _hide_oauth2_token_dialog(self):
+        """Hide the authorization code dialog, keeping it for the next use"""
+        self._oauth2_token_dialog.grab_release()
+        self._oauth2_token_dialog.withdraw()
+    
+    def _on_oauth2_token_dialog_destroyed(self, event):
+        """Forget the cached dialog once its window is destroyed"""
+        if event.widget is self._oauth2_token_dialog:
+            self._oauth2_token_dialog = None
+    
+    def _on_get_token(self):
+        """Exchange the entered authorization code for an access token"""
+        code = self._oauth2_code_var.get().strip()
+        if not code:
+            messagebox.showerror("Error", "Please enter authorization code")
+            return
+        
+        client_secret = self.oauth2_vars["oauth2_client_secret"].get()
+        token_url = self.oauth2_vars["oauth2_token_url"].get()
+        
+        if self.request_controller.get_oauth2_token(code, client_secret, token_url):
+            self._hide_oauth2_token_dialog()
+            messagebox.showinfo("Success", "Access token obtained successfully!")
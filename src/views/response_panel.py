@@ -11,14 +11,81 @@ with proper formatting and syntax highlighting.
 :license: Apache 2.0, see LICENSE for more details.
 """
 
+import codecs
+import json
+import re
 import tkinter as tk
 from tkinter import ttk
 from typing import Optional
-import json
+
+import orjson
 
 from models.response_model import ResponseModel
-from views.components import SyntaxText
-from utils.logging_config import logger, redact_headers
+from views.components.syntax_text import SyntaxText
+from utils.logging_config import logger, redact_headers, is_debug_enabled
+
+# Bodies longer than this many characters are shown a chunk at a time; the
+# next chunk is appended when the view is scrolled near the end
+DISPLAY_CHUNK_SIZE = 200_000
+# Fraction of the content scrolled past that triggers loading the next chunk
+LOAD_MORE_AT = 0.9
+
+# Only this many bytes of a response body are decoded and displayed
+DISPLAY_BYTE_LIMIT = 1 << 20  # 1 MiB
+
+# Integer literals long enough that they may not fit in 64 bits
+_RE_LONG_INT = re.compile(rb'\d{19,}')
+
+# Content-type prefixes whose bodies are never decoded for display
+BINARY_CONTENT_TYPES = (
+    'image/', 'audio/', 'video/', 'font/',
+    'application/octet-stream', 'application/pdf', 'application/zip',
+)
+
+def _chunk_end(text: str, start: int) -> int:
+    """
+    Return where the display chunk of text beginning at start ends.
+    
+    Chunks end just after a newline when there is one, so JSON tokens are
+    never split between chunks.
+    """
+    limit = start + DISPLAY_CHUNK_SIZE
+    if limit >= len(text):
+        return len(text)
+    newline = text.rfind("\n", start, limit)
+    return newline + 1 if newline >= 0 else limit
+
+def _decode_for_display(raw: bytes, errors: str) -> str:
+    """Decode at most DISPLAY_BYTE_LIMIT bytes of raw, noting any truncation"""
+    if len(raw) <= DISPLAY_BYTE_LIMIT:
+        return raw.decode('utf-8', errors)
+    # Not final, so a character split by the limit is dropped rather than
+    # treated as an error
+    decoder = codecs.getincrementaldecoder('utf-8')(errors)
+    text = decoder.decode(memoryview(raw)[:DISPLAY_BYTE_LIMIT])
+    return f"{text}\n\n... [truncated {len(raw) - DISPLAY_BYTE_LIMIT} bytes]\n"
+
+def _format_json(raw: bytes) -> str:
+    """
+    Pretty-print a JSON body with two-space indentation.
+    
+    orjson parses the bytes as they are, so a valid body is never decoded
+    separately. It turns integers outside the 64-bit range into floats,
+    though, and cannot dump nesting deeper than 254 levels, so those bodies
+    go through the stdlib json module instead.
+    """
+    if not _RE_LONG_INT.search(raw):
+        try:
+            return orjson.dumps(orjson.loads(raw), option=orjson.OPT_INDENT_2).decode('utf-8')
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(json.loads(raw), indent=2, ensure_ascii=False)
+
+def _decoded_content(response: ResponseModel, errors: str) -> str:
+    """Return the display text of response's body, decoding it only once"""
+    if response._decoded is None:
+        response._decoded = _decode_for_display(response.content or b'', errors)
+    return response._decoded
 
 class ResponsePanel:
     """
@@ -81,12 +148,12 @@ class ResponsePanel:
         self.response_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Vertical scrollbar
-        vert_scroll = ttk.Scrollbar(
+        self.vert_scroll = ttk.Scrollbar(
             text_frame,
             orient=tk.VERTICAL,
             command=self.response_text.yview
         )
-        vert_scroll.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.vert_scroll.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
         # Horizontal scrollbar
         horz_scroll = ttk.Scrollbar(
@@ -98,9 +165,63 @@ class ResponsePanel:
         
         # Configure text widget scrolling
         self.response_text.configure(
-            yscrollcommand=vert_scroll.set,
+            yscrollcommand=self._on_yscroll,
             xscrollcommand=horz_scroll.set
         )
+        
+        # Content not yet inserted into response_text: the full text, the
+        # offset of the first character still pending, and whether the
+        # pending part gets JSON highlighting
+        self._pending_text = ""
+        self._pending_pos = 0
+        self._pending_highlight = False
+        
+        # The response on display, and the options last set on each info
+        # label, so repeated updates can be skipped
+        self._last_response: Optional[ResponseModel] = None
+        self._label_options = {}
+    
+    def _config_label(self, label: ttk.Label, **options):
+        """Configure label, skipping the Tcl call if nothing changed"""
+        if self._label_options.get(label) != options:
+            label.config(**options)
+            self._label_options[label] = options
+    
+    def _on_yscroll(self, first: str, last: str):
+        """Update the scrollbar and load more content near the end"""
+        self.vert_scroll.set(first, last)
+        if self._pending_pos < len(self._pending_text) and float(last) >= LOAD_MORE_AT:
+            self._load_more()
+    
+    def _load_more(self):
+        """Append the next chunk of pending content"""
+        start = self._pending_pos
+        end = _chunk_end(self._pending_text, start)
+        self._pending_pos = end
+        self.response_text.append(self._pending_text[start:end], self._pending_highlight)
+        if end >= len(self._pending_text):
+            self._pending_text = ""
+            self._pending_pos = 0
+    
+    def _show_content(self, content: str, content_type: Optional[str],
+                      formatted: bool = False):
+        """
+        Show content, inserting only its first chunk if it is large.
+        
+        formatted marks content as JSON already pretty-printed by
+        _format_json, which is highlighted without being parsed again.
+        """
+        end = _chunk_end(content, 0)
+        if end < len(content):
+            self._pending_text, self._pending_pos = content, end
+            content = content[:end]
+        else:
+            self._pending_text, self._pending_pos = "", 0
+        # Later chunks are highlighted only if the first one was shown as
+        # JSON, whether from the content type or from sniffing the text
+        self._pending_highlight = self.response_text.set_content(
+            content, content_type, formatted
+        )
     
     def display_response(self, response: ResponseModel):
         """
@@ -109,18 +230,23 @@ class ResponsePanel:
         Args:
             response (ResponseModel): The response to display
         """
-        try:
-            safe_headers = redact_headers(response.headers or {})
-            logger.debug({
-                'status_code': response.status_code,
-                'reason': response.reason,
-                'headers': safe_headers,
-                'elapsed_ms': response.elapsed_time,
-                'size': len(response.content or b''),
-                'error': response.error,
-            })
-        except Exception:
-            logger.debug("Failed to log response safely", exc_info=True)
+        # Nothing to do if this response is already on display
+        if response is self._last_response:
+            return
+        
+        if is_debug_enabled():
+            try:
+                safe_headers = redact_headers(response.headers or {})
+                logger.debug({
+                    'status_code': response.status_code,
+                    'reason': response.reason,
+                    'headers': safe_headers,
+                    'elapsed_ms': response.elapsed_time,
+                    'size': len(response.content or b''),
+                    'error': response.error,
+                })
+            except Exception:
+                logger.debug("Failed to log response safely", exc_info=True)
         
         # Update status with color
         status_code = response.status_code
@@ -129,51 +255,67 @@ class ResponsePanel:
             else "red" if status_code == 0 or status_code >= 400
             else "orange"
         )
-        self.status_label.config(
+        self._config_label(
+            self.status_label,
             text=f"Status: {status_code} {response.reason}",
             foreground=status_color
         )
         
         # Update time
-        self.time_label.config(text=f"Time: {response.elapsed_time} ms")
+        self._config_label(self.time_label, text=f"Time: {response.elapsed_time} ms")
         
         # Update size
-        content_length = len(response.content) if response.content else 0
-        size_text = (
-            f"{round(content_length / 1024, 2)} KB"
-            if content_length > 1024
-            else f"{content_length} bytes"
-        )
-        self.size_label.config(text=f"Size: {size_text}")
+        self._config_label(self.size_label, text=f"Size: {response.size_formatted}")
+        
+        self._show_body(response)
         
+        # Scroll to top
+        self.response_text.see("1.0")
+        # Only now is the response fully on display
+        self._last_response = response
+    
+    def _show_body(self, response: ResponseModel):
+        """Show the response body, or error details for a failed request"""
         # If error response, show error details immediately
         if response.status_code == 0:
             error_text = response.error or "An unknown error occurred."
-            self.response_text.set_content(error_text, None)
-            self.response_text.see("1.0")
+            self._show_content(error_text, None)
             return
 
         # Display content with formatting for non-error responses
         content_type = response.headers.get('content-type', '')
+        content_type_lower = content_type.lower()
+        
+        # Known binary types are reported without decoding the body
+        if response.content and content_type_lower.startswith(BINARY_CONTENT_TYPES):
+            self._show_content(f"Binary content ({len(response.content)} bytes)", None)
+            return
         
         try:
-            # Decode content from bytes
-            content = response.content.decode('utf-8') if response.content else ''
+            # Decode content from bytes; text/* bodies show undecodable bytes
+            # as replacement characters rather than being rejected
+            errors = 'replace' if content_type_lower.startswith('text/') else 'strict'
             
             # If it's JSON content, try to parse and format it
-            if 'json' in content_type.lower():
+            is_json = 'json' in content_type_lower
+            if is_json and len(response.content or b'') <= DISPLAY_BYTE_LIMIT:
                 try:
-                    parsed_json = json.loads(content)
-                    formatted_content = json.dumps(parsed_json, indent=2)
-                    self.response_text.set_content(formatted_content, content_type)
-                except json.JSONDecodeError as e:
-                    logger.error(f"JSON parsing error: {e}")
-                    self.response_text.set_content(content, None)
+                    # Format once per response; showing it again reuses the result
+                    formatted_content = response._formatted_json
+                    if formatted_content is None:
+                        formatted_content = _format_json(response.content)
+                        response._formatted_json = formatted_content
+                    self._show_content(formatted_content, content_type, formatted=True)
+                except (json.JSONDecodeError, RecursionError) as e:
+                    # RecursionError: nesting too deep even for the stdlib
+                    logger.error("JSON parsing error: %s", e)
+                    self._show_content(_decoded_content(response, errors), None)
+            elif is_json:
+                # Bodies over the display limit can only be shown partially,
+                # which is not valid JSON, so show them as raw text
+                self._show_content(_decoded_content(response, errors), None)
             else:
-                self.response_text.set_content(content, content_type)
+                self._show_content(_decoded_content(response, errors), content_type)
         except UnicodeDecodeError as e:
-            logger.error(f"Content decoding error: {e}")
-            self.response_text.set_content("Binary content (cannot display)", None)
-        
-        # Scroll to top
-        self.response_text.see("1.0") 
\ No newline at end of file
+            logger.error("Content decoding error: %s", e)
+            self._show_content("Binary content (cannot display)", None) 
\ No newline at end of file